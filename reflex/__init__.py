@@ -226,8 +226,12 @@ def __getattr__(name: str) -> Type:
         module = importlib.import_module(_MAPPING[name])
 
         # Get the attribute from the module if the name is not the module itself.
-        return (
+        attr = (
             getattr(module, name) if name != _MAPPING[name].rsplit(".")[-1] else module
         )
+
+        # Cache the attribute, so later lookups do not go through this function.
+        globals()[name] = attr
+        return attr
     except ModuleNotFoundError:
         raise AttributeError(f"module 'reflex' has no attribute {name}") from None
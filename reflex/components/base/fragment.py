@@ -7,3 +7,5 @@ class Fragment(Component):
 
     library = "react"
     tag = "Fragment"
+
+    _is_transparent_wrapper = True
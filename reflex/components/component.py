@@ -13,10 +13,12 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
 )
@@ -198,9 +200,20 @@ class Component(BaseComponent, ABC):
     # only components that are allowed as parent
     _valid_parents: List[str] = []
 
+    # Whether the component only wraps other components, like fragments or conds.
+    # Such components are allowed regardless of child and parent restrictions.
+    # The flag is not inherited, so subclasses of a wrapper are constrained.
+    _is_transparent_wrapper: ClassVar[bool] = False
+
     # props to change the name of
     _rename_props: Dict[str, str] = {}
 
+    # The arg specs of the event triggers declared as EventHandler fields.
+    _declared_event_triggers: ClassVar[Dict[str, Any]] = {}
+
+    # Props that may still be passed with a deprecated underscore suffix.
+    _deprecated_underscore_props: ClassVar[Tuple[str, ...]] = ()
+
     # custom attribute
     custom_attrs: Dict[str, Union[Var, str]] = {}
 
@@ -222,6 +235,20 @@ class Component(BaseComponent, ABC):
         # Get all the props for the component.
         props = cls.get_props()
 
+        cls._deprecated_underscore_props = tuple(
+            prop for prop in ["type", "min", "max"] if prop in props
+        )
+
+        # Only the wrapper classes themselves are exempt from child constraints.
+        cls._is_transparent_wrapper = cls.__dict__.get("_is_transparent_wrapper", False)
+
+        # Collect the event triggers declared as EventHandler fields.
+        cls._declared_event_triggers = {
+            field.name: getattr(field.type_, "args_spec", lambda: [])
+            for field in cls.get_fields().values()
+            if types._issubclass(field.type_, EventHandler)
+        }
+
         # Convert fields to props, setting default values.
         for field in cls.get_fields().values():
             # If the field is not a component prop, skip it.
@@ -241,7 +268,11 @@ class Component(BaseComponent, ABC):
             for parent in reversed(cls.mro()):
                 if issubclass(parent, Component) and parent._rename_props:
                     inherited_rename_props.update(parent._rename_props)
-            cls._rename_props = inherited_rename_props
+            # Props are rendered with camelCase names, so match the keys to them.
+            cls._rename_props = {
+                format.to_camel_case(old_prop, allow_hyphens=True): new_prop
+                for old_prop, new_prop in inherited_rename_props.items()
+            }
 
     def __init__(self, *args, **kwargs):
         """Initialize the component.
@@ -264,12 +295,37 @@ class Component(BaseComponent, ABC):
                 if prop in kwargs
             },
         }
-        super().__init__(**initial_kwargs)
+        # Get the component fields, triggers, and props.
+        fields = self.get_fields()
+
+        if isinstance(children, list) and all(
+            isinstance(child, BaseComponent) for child in children
+        ):
+            # The initial fields are only read while collecting the triggers and
+            # are validated when the component is constructed below, so skip
+            # validation. This mirrors pydantic v1's BaseModel.construct, which
+            # sets __dict__ and __fields_set__ and then the private attributes.
+            object.__setattr__(
+                self,
+                "__dict__",
+                {
+                    **{
+                        name: field.get_default()
+                        if field.default_factory
+                        else field.default
+                        for name, field in fields.items()
+                    },
+                    **initial_kwargs,
+                },
+            )
+            object.__setattr__(self, "__fields_set__", set(initial_kwargs))
+            self._init_private_attributes()
+        else:
+            # Let pydantic validate (and report) any unexpected children.
+            super().__init__(**initial_kwargs)
 
         self._validate_component_children(children)
 
-        # Get the component fields, triggers, and props.
-        fields = self.get_fields()
         component_specific_triggers = self.get_event_triggers()
         triggers = component_specific_triggers.keys()
         props = self.get_props()
@@ -467,13 +523,9 @@ class Component(BaseComponent, ABC):
             EventTriggers.ON_MOUNT: lambda: [],
             EventTriggers.ON_UNMOUNT: lambda: [],
         }
-        # Look for component specific triggers,
+        # Add component specific triggers,
         # e.g. variable declared as EventHandler types.
-        for field in self.get_fields().values():
-            if types._issubclass(field.type_, EventHandler):
-                default_triggers[field.name] = getattr(
-                    field.type_, "args_spec", lambda: []
-                )
+        default_triggers.update(self._declared_event_triggers)
         return default_triggers
 
     def __repr__(self) -> str:
@@ -571,13 +623,15 @@ class Component(BaseComponent, ABC):
 
     @classmethod
     @lru_cache(maxsize=None)
-    def get_props(cls) -> Set[str]:
+    def get_props(cls) -> FrozenSet[str]:
         """Get the unique fields for the component.
 
+        The result is cached per class, so it is returned as an immutable set.
+
         Returns:
             The unique fields.
         """
-        return set(cls.get_fields()) - set(Component.get_fields())
+        return frozenset(cls.get_fields()) - frozenset(Component.get_fields())
 
     @classmethod
     @lru_cache(maxsize=None)
@@ -622,20 +676,23 @@ class Component(BaseComponent, ABC):
         from reflex.components.base.bare import Bare
 
         # Translate deprecated props to new names.
-        new_prop_names = [
-            prop for prop in cls.get_props() if prop in ["type", "min", "max"]
+        deprecated_props = [
+            prop for prop in cls._deprecated_underscore_props if f"{prop}_" in props
         ]
-        for prop in new_prop_names:
-            under_prop = f"{prop}_"
-            if under_prop in props:
-                console.deprecate(
-                    f"Underscore suffix for prop `{under_prop}`",
-                    reason=f"for consistency. Use `{prop}` instead.",
-                    deprecation_version="0.4.0",
-                    removal_version="0.5.0",
-                    dedupe=False,
-                )
-                props[prop] = props.pop(under_prop)
+        if deprecated_props:
+            # Emit a single warning for all the deprecated props of this call.
+            console.deprecate(
+                "Underscore suffix for props "
+                + ", ".join(f"`{prop}_`" for prop in deprecated_props),
+                reason="for consistency. Use "
+                + ", ".join(f"`{prop}`" for prop in deprecated_props)
+                + " instead.",
+                deprecation_version="0.4.0",
+                removal_version="0.5.0",
+                dedupe=False,
+            )
+            for prop in deprecated_props:
+                props[prop] = props.pop(f"{prop}_")
 
         # Filter out None props
         props = {key: value for key, value in props.items() if value is not None}
@@ -739,10 +796,12 @@ class Component(BaseComponent, ABC):
         if not self._rename_props:
             return
 
+        # The rename map is flattened per class, so each prop is a single lookup.
         for ix, prop in enumerate(rendered_dict["props"]):
-            for old_prop, new_prop in self._rename_props.items():
-                if prop.startswith(old_prop):
-                    rendered_dict["props"][ix] = prop.replace(old_prop, new_prop, 1)
+            name, sep, value = prop.partition("=")
+            new_name = self._rename_props.get(name)
+            if new_name is not None:
+                rendered_dict["props"][ix] = f"{new_name}{sep}{value}"
 
     def _validate_component_children(self, children: List[Component]):
         """Validate the children components.
@@ -753,7 +812,6 @@ class Component(BaseComponent, ABC):
         """
         from reflex.components.base.fragment import Fragment
         from reflex.components.core.cond import Cond
-        from reflex.components.core.foreach import Foreach
         from reflex.components.core.match import Match
 
         no_valid_parents_defined = all(child._valid_parents == [] for child in children)
@@ -764,54 +822,24 @@ class Component(BaseComponent, ABC):
         ):
             return
 
-        comp_name = type(self).__name__
-        allowed_components = [
-            comp.__name__ for comp in (Fragment, Foreach, Cond, Match)
-        ]
+        parent_cls = type(self)
 
         def validate_child(child):
-            child_name = type(child).__name__
-
-            # Iterate through the immediate children of fragment
+            # Validate the wrapped components against the same parent.
             if isinstance(child, Fragment):
                 for c in child.children:
                     validate_child(c)
-
-            if isinstance(child, Cond):
+            elif isinstance(child, Cond):
                 validate_child(child.comp1)
                 validate_child(child.comp2)
-
-            if isinstance(child, Match):
+            elif isinstance(child, Match):
                 for cases in child.match_cases:
                     validate_child(cases[-1])
                 validate_child(child.default)
 
-            if self._invalid_children and child_name in self._invalid_children:
-                raise ValueError(
-                    f"The component `{comp_name}` cannot have `{child_name}` as a child component"
-                )
-
-            if self._valid_children and child_name not in [
-                *self._valid_children,
-                *allowed_components,
-            ]:
-                valid_child_list = ", ".join(
-                    [f"`{v_child}`" for v_child in self._valid_children]
-                )
-                raise ValueError(
-                    f"The component `{comp_name}` only allows the components: {valid_child_list} as children. Got `{child_name}` instead."
-                )
-
-            if child._valid_parents and comp_name not in [
-                *child._valid_parents,
-                *allowed_components,
-            ]:
-                valid_parent_list = ", ".join(
-                    [f"`{v_parent}`" for v_parent in child._valid_parents]
-                )
-                raise ValueError(
-                    f"The component `{child_name}` can only be a child of the components: {valid_parent_list}. Got `{comp_name}` instead."
-                )
+            error = _validate_child_pair(parent_cls, type(child))
+            if error is not None:
+                raise ValueError(error)
 
         for child in children:
             validate_child(child)
@@ -1247,10 +1275,7 @@ class Component(BaseComponent, ABC):
         Returns:
             An import var.
         """
-        # If the tag is dot-qualified, only import the left-most name.
-        tag = self.tag.partition(".")[0] if self.tag else None
-        alias = self.alias.partition(".")[0] if self.alias else None
-        return ImportVar(tag=tag, is_default=self.is_default, alias=alias)
+        return _get_import_var(self.tag, self.is_default, self.alias)
 
     @staticmethod
     def _get_app_wrap_components() -> dict[tuple[int, str], Component]:
@@ -1284,6 +1309,72 @@ class Component(BaseComponent, ABC):
         return components
 
 
+@lru_cache(maxsize=None)
+def _get_import_var(
+    tag: Optional[str], is_default: bool, alias: Optional[str]
+) -> ImportVar:
+    """Get the import var for a component tag.
+
+    Import vars are never mutated, so one instance is shared per tag.
+
+    Args:
+        tag: The tag of the component.
+        is_default: Whether the tag is the default export of its library.
+        alias: The alias of the tag.
+
+    Returns:
+        The import var.
+    """
+    # If the tag is dot-qualified, only import the left-most name.
+    tag = tag.partition(".")[0] if tag else None
+    alias = alias.partition(".")[0] if alias else None
+    return ImportVar(tag=tag, is_default=is_default, alias=alias)
+
+
+@lru_cache(maxsize=10000)
+def _validate_child_pair(
+    parent_cls: Type[Component], child_cls: Type[Component]
+) -> Optional[str]:
+    """Check whether a component class may be a child of a parent component class.
+
+    The rules only depend on class attributes, so the result is cached per pair.
+
+    Args:
+        parent_cls: The parent component class.
+        child_cls: The child component class.
+
+    Returns:
+        The error message if the child is not allowed, otherwise None.
+    """
+    comp_name = parent_cls.__name__
+    child_name = child_cls.__name__
+
+    if child_name in parent_cls._invalid_children:
+        return f"The component `{comp_name}` cannot have `{child_name}` as a child component"
+
+    if (
+        parent_cls._valid_children
+        and not child_cls._is_transparent_wrapper
+        and child_name not in parent_cls._valid_children
+    ):
+        valid_child_list = ", ".join(
+            [f"`{v_child}`" for v_child in parent_cls._valid_children]
+        )
+        return f"The component `{comp_name}` only allows the components: {valid_child_list} as children. Got `{child_name}` instead."
+
+    if (
+        child_cls._valid_parents
+        and not parent_cls._is_transparent_wrapper
+        and comp_name not in child_cls._valid_parents
+    ):
+        valid_parent_list = ", ".join(
+            [f"`{v_parent}`" for v_parent in child_cls._valid_parents]
+        )
+        return f"The component `{child_name}` can only be a child of the components: {valid_parent_list}. Got `{comp_name}` instead."
+
+    return None
+
+
 class CustomComponent(Component):
     """A custom user-defined component."""
 
@@ -1379,13 +1470,14 @@ class CustomComponent(Component):
         return hash(self.tag)
 
     @classmethod
-    def get_props(cls) -> Set[str]:
+    @lru_cache(maxsize=None)
+    def get_props(cls) -> FrozenSet[str]:
         """Get the props for the component.
 
         Returns:
             The set of component props.
         """
-        return set()
+        return frozenset()
 
     def _get_all_custom_components(
         self, seen: set[str] | None = None
@@ -29,6 +29,8 @@ class Cond(MemoizationLeaf):
     # The component to render if the cond is false.
     comp2: BaseComponent = None  # type: ignore
 
+    _is_transparent_wrapper = True
+
     @classmethod
     def create(
         cls,
@@ -156,6 +158,9 @@ def cond(condition: Any, c1: Any, c2: Any = None):
         assert c2 is None or isinstance(
             c2, BaseComponent
         ), "Both arguments must be components."
+        # A constant condition always renders the same branch.
+        if isinstance(condition, bool):
+            return c1 if condition else (c2 if c2 is not None else Fragment.create())
         return Cond.create(cond_var, c1, c2)
     if isinstance(c1, Var):
         var_datas.append(c1._var_data)
@@ -178,6 +183,11 @@ def cond(condition: Any, c1: Any, c2: Any = None):
     # convert the truth and false cond parts into vars so the _var_data can be obtained.
     c1 = create_var(c1)
     c2 = create_var(c2)
+
+    # A constant condition always evaluates to the same part.
+    if isinstance(condition, bool):
+        return c1 if condition else c2
+
     var_datas.extend([c1._var_data, c2._var_data])
 
     # Create the conditional var.
@@ -17,6 +17,8 @@ class Foreach(Component):
 
     _memoization_mode = MemoizationMode(recursive=False)
 
+    _is_transparent_wrapper = True
+
     # The iterable to create components from.
     iterable: Var[Iterable]
 
@@ -25,6 +25,8 @@ class Match(MemoizationLeaf):
     # The catchall case to match.
     default: Any
 
+    _is_transparent_wrapper = True
+
     @classmethod
     def create(cls, cond: Any, *cases) -> Union[Component, BaseVar]:
         """Create a Match Component.
@@ -50,6 +52,8 @@ class Match(MemoizationLeaf):
                 "For cases with return types as Vars, a default case must be provided"
             )
 
+        match_cases = cls._merge_duplicate_cases(match_cases, default)
+
         return cls._create_match_cond_var_or_component(
             match_cond_var, match_cases, default
         )
@@ -192,6 +196,58 @@ class Match(MemoizationLeaf):
                     f" of type {type(case[-1])!r} is not {return_type}"
                 )
 
+    @staticmethod
+    def _same_return_value(first: Any, second: Any) -> bool:
+        """Check whether two case return values render the same.
+
+        Args:
+            first: The first return value.
+            second: The second return value.
+
+        Returns:
+            Whether the return values are the same var or component.
+        """
+        if isinstance(first, Var) and isinstance(second, Var):
+            # Compare the emitted JS, since Var.equals ignores _var_is_string.
+            return (
+                first._var_name_unwrapped == second._var_name_unwrapped
+                and first._var_data == second._var_data
+            )
+        return first is second
+
+    @classmethod
+    def _merge_duplicate_cases(
+        cls,
+        match_cases: List[List[BaseVar]],
+        default: Optional[Union[BaseVar, BaseComponent]],
+    ) -> List[List[BaseVar]]:
+        """Merge adjacent cases that return the same value.
+
+        Only adjacent cases are merged, since moving a condition past another
+        case could change which case matches first. Trailing cases returning the
+        default value are dropped, as their values fall through to the default.
+
+        Args:
+            match_cases: The match cases.
+            default: The default case.
+
+        Returns:
+            The merged match cases.
+        """
+        merged_cases = [list(match_cases[0])]
+        for case in match_cases[1:]:
+            previous = merged_cases[-1]
+            if cls._same_return_value(previous[-1], case[-1]):
+                previous[-1:-1] = case[:-1]
+            else:
+                merged_cases.append(list(case))
+
+        while len(merged_cases) > 1 and cls._same_return_value(
+            merged_cases[-1][-1], default
+        ):
+            merged_cases.pop()
+        return merged_cases
+
     @classmethod
     def _create_match_cond_var_or_component(
         cls,
@@ -52,6 +52,6 @@ class Grid(el.Div, RadixThemesComponent):
     # Reflex maps the "spacing" prop to "gap" prop.
     _rename_props: Dict[str, str] = {
         "spacing": "gap",
-        "spacing_x": "gap_x",
-        "spacing_y": "gap_y",
+        "spacing_x": "gapX",
+        "spacing_y": "gapY",
     }
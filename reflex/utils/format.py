@@ -348,6 +348,45 @@ def format_cond(
     return wrap(f"{cond} ? {true_value} : {false_value}", "{")
 
 
+# Literal strings made of these characters read the same in a JS template literal
+# and need no escaping in JSON or in a single quoted JS string.
+MATCH_CASE_SAFE_STRING = re.compile(r"[\w \-.,:;!?#%&*+=/@|~^()\[\]<>]*")
+
+# Largest integer that JS numbers represent exactly.
+MAX_SAFE_JS_INTEGER = 2**53 - 1
+
+
+def format_match_case(condition: Var) -> str:
+    """Format the label of a match case.
+
+    Match conditions are compared by their JSON serialization. For plain int and
+    string literals the serialization is computed here, so the emitted switch
+    compares constants instead of calling JSON.stringify for every case.
+
+    Args:
+        condition: The case condition.
+
+    Returns:
+        The JS expression for the case label.
+    """
+    if condition._var_is_local and not condition._var_data:
+        name = condition._var_name
+        if (
+            condition._var_type is int
+            and not condition._var_is_string
+            and re.fullmatch(r"-?\d+", name)
+            and abs(int(name)) <= MAX_SAFE_JS_INTEGER
+        ):
+            return f"'{int(name)}'"
+        if (
+            condition._var_type is str
+            and condition._var_is_string
+            and MATCH_CASE_SAFE_STRING.fullmatch(name)
+        ):
+            return f"'\"{name}\"'"
+    return f"JSON.stringify({condition._var_name_unwrapped})"
+
+
 def format_match(cond: str | Var, match_cases: List[BaseVar], default: Var) -> str:
     """Format a match expression whose return type is a Var.
 
@@ -367,10 +406,7 @@ def format_match(cond: str | Var, match_cases: List[BaseVar], default: Var) -> s
         return_value = case[-1]
 
         case_conditions = " ".join(
-            [
-                f"case JSON.stringify({condition._var_name_unwrapped}):"
-                for condition in conditions
-            ]
+            [f"case {format_match_case(condition)}:" for condition in conditions]
         )
         case_code = (
             f"{case_conditions}  return ({return_value._var_name_unwrapped});  break;"
@@ -317,6 +317,26 @@ def _extract_var_data(value: Iterable) -> list[VarData | None]:
     return var_datas
 
 
+# Literal types whose var name only depends on the value.
+_SCALAR_LITERAL_TYPES = (int, float, bool)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _get_scalar_literal_name(value: Any) -> str:
+    """Get the var name of a scalar literal.
+
+    The cache is typed, so 1 and True are cached apart. Floats are not cached,
+    since equal floats such as 0.0 and -0.0 serialize differently.
+
+    Args:
+        value: The int or bool value.
+
+    Returns:
+        The serialized value.
+    """
+    return format.json_dumps(value)
+
+
 class Var:
     """An abstract var."""
 
@@ -363,13 +383,26 @@ class Var:
         if isinstance(value, Var):
             return value
 
+        # Scalar literals have no var data and int/bool names are cached.
+        type_ = type(value)
+        if type_ in _SCALAR_LITERAL_TYPES:
+            return BaseVar(
+                _var_name=(
+                    format.json_dumps(value)
+                    if type_ is float
+                    else _get_scalar_literal_name(value)
+                ),
+                _var_type=type_,
+                _var_is_local=_var_is_local,
+                _var_is_string=_var_is_string,
+            )
+
         # Try to pull the imports and hooks from contained values.
         _var_data = None
         if not isinstance(value, str):
             _var_data = VarData.merge(*_extract_var_data(value))
 
         # Try to serialize the value.
-        type_ = type(value)
         name = value if type_ in types.JSONType else serializers.serialize(value)
         if name is None:
             raise TypeError(
@@ -408,9 +441,12 @@ class Var:
         return var
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def __class_getitem__(cls, type_: str) -> _GenericAlias:
         """Get a typed var.
 
+        The alias only depends on the type, so one instance is shared per type.
+
         Args:
             type_: The type of the var.
 
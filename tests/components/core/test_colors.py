@@ -52,11 +52,11 @@ def test_color(color, expected):
     "cond_var, expected",
     [
         (
-            rx.cond(True, rx.color("mint"), rx.color("tomato", 5)),
+            rx.cond(Var.create(True), rx.color("mint"), rx.color("tomato", 5)),
             "{isTrue(true) ? `var(--mint-7)` : `var(--tomato-5)`}",
         ),
         (
-            rx.cond(True, rx.color(ColorState.color), rx.color(ColorState.color, 5)),  # type: ignore
+            rx.cond(Var.create(True), rx.color(ColorState.color), rx.color(ColorState.color, 5)),  # type: ignore
             "{isTrue(true) ? `var(--${state__color_state.color}-7)` : `var(--${state__color_state.color}-5)`}",
         ),
         (
@@ -66,8 +66,8 @@ def test_color(color, expected):
                 ("second", rx.color("tomato", 5)),
                 rx.color(ColorState.color, 2),  # type: ignore
             ),
-            "{(() => { switch (JSON.stringify(`condition`)) {case JSON.stringify(`first`):  return (`var(--mint-7)`);"
-            "  break;case JSON.stringify(`second`):  return (`var(--tomato-5)`);  break;default:  "
+            "{(() => { switch (JSON.stringify(`condition`)) {case '\"first\"':  return (`var(--mint-7)`);"
+            "  break;case '\"second\"':  return (`var(--tomato-5)`);  break;default:  "
             "return (`var(--${state__color_state.color}-2)`);  break;};})()}",
         ),
         (
@@ -77,8 +77,8 @@ def test_color(color, expected):
                 ("second", rx.color(ColorState.color, 5)),  # type: ignore
                 rx.color(ColorState.color, 2),  # type: ignore
             ),
-            "{(() => { switch (JSON.stringify(`condition`)) {case JSON.stringify(`first`):  "
-            "return (`var(--${state__color_state.color}-7)`);  break;case JSON.stringify(`second`):  "
+            "{(() => { switch (JSON.stringify(`condition`)) {case '\"first\"':  "
+            "return (`var(--${state__color_state.color}-7)`);  break;case '\"second\"':  "
             "return (`var(--${state__color_state.color}-5)`);  break;default:  "
             "return (`var(--${state__color_state.color}-2)`);  break;};})()}",
         ),
@@ -20,7 +20,7 @@ def cond_state(request):
 
 def test_f_string_cond_interpolation():
     # make sure backticks inside interpolation don't get escaped
-    var = Var.create(f"x {cond(True, 'a', 'b')}")
+    var = Var.create(f"x {cond(Var.create(True), 'a', 'b')}")
     assert str(var) == "x ${isTrue(true) ? `a` : `b`}"
 
 
@@ -85,7 +85,7 @@ def test_prop_cond(c1: Any, c2: Any):
         c2: false condition value
     """
     prop_cond = cond(
-        True,
+        Var.create(True),
         c1,
         c2,
     )
@@ -107,7 +107,7 @@ def test_cond_no_mix():
 def test_cond_no_else():
     """Test if cond can be used without else."""
     # Components should support the use of cond without else
-    comp = cond(True, Text.create("hello"))
+    comp = cond(Var.create(True), Text.create("hello"))
     assert isinstance(comp, Fragment)
     comp = comp.children[0]
     assert isinstance(comp, Cond)
@@ -118,3 +118,15 @@ def test_cond_no_else():
     # Props do not support the use of cond without else
     with pytest.raises(ValueError):
         cond(True, "hello")  # type: ignore
+
+
+def test_cond_constant_condition():
+    """Test that a constant condition is folded to the selected branch."""
+    hello = Text.create("hello")
+    world = Text.create("world")
+    assert cond(True, hello, world) is hello
+    assert cond(False, hello, world) is world
+    assert cond(False, hello).render() == Fragment.create().render()
+
+    assert str(cond(True, "a", "b")) == "{`a`}"
+    assert str(cond(False, 1, 2)) == "2"
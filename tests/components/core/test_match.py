@@ -6,7 +6,7 @@ import reflex as rx
 from reflex.components.core.match import Match
 from reflex.state import BaseState
 from reflex.utils.exceptions import MatchTypeError
-from reflex.vars import BaseVar
+from reflex.vars import BaseVar, Var
 
 
 class MatchState(BaseState):
@@ -99,8 +99,8 @@ def test_match_components():
                 (MatchState.string, f"{MatchState.value} - string"),
                 "default value",
             ),
-            "(() => { switch (JSON.stringify(match_state.value)) {case JSON.stringify(1):  return (`first`);  break;case JSON.stringify(2): case JSON.stringify(3):  return "
-            "(`second value`);  break;case JSON.stringify([1, 2]):  return (`third-value`);  break;case JSON.stringify(`random`):  "
+            "(() => { switch (JSON.stringify(match_state.value)) {case '1':  return (`first`);  break;case '2': case '3':  return "
+            "(`second value`);  break;case JSON.stringify([1, 2]):  return (`third-value`);  break;case '\"random\"':  "
             'return (`fourth_value`);  break;case JSON.stringify({"foo": "bar"}):  return (`fifth value`);  '
             "break;case JSON.stringify(((match_state.num) + (1))):  return (`sixth value`);  break;case JSON.stringify(`${match_state.value} - string`):  "
             "return (match_state.string);  break;case JSON.stringify(match_state.string):  return (`${match_state.value} - string`);  break;default:  "
@@ -118,13 +118,38 @@ def test_match_components():
                 (MatchState.string, f"{MatchState.value} - string"),
                 MatchState.string,
             ),
-            "(() => { switch (JSON.stringify(match_state.value)) {case JSON.stringify(1):  return (`first`);  break;case JSON.stringify(2): case JSON.stringify(3):  return "
-            "(`second value`);  break;case JSON.stringify([1, 2]):  return (`third-value`);  break;case JSON.stringify(`random`):  "
+            "(() => { switch (JSON.stringify(match_state.value)) {case '1':  return (`first`);  break;case '2': case '3':  return "
+            "(`second value`);  break;case JSON.stringify([1, 2]):  return (`third-value`);  break;case '\"random\"':  "
             'return (`fourth_value`);  break;case JSON.stringify({"foo": "bar"}):  return (`fifth value`);  '
             "break;case JSON.stringify(((match_state.num) + (1))):  return (`sixth value`);  break;case JSON.stringify(`${match_state.value} - string`):  "
             "return (match_state.string);  break;case JSON.stringify(match_state.string):  return (`${match_state.value} - string`);  break;default:  "
             "return (match_state.string);  break;};})()",
         ),
+        (
+            (
+                (1, "same"),
+                (2, "same"),
+                (3, "other"),
+                (4, "same"),
+                (5, "default value"),
+                (6, "default value"),
+                "default value",
+            ),
+            "(() => { switch (JSON.stringify(match_state.value)) {case '1': case '2':  return (`same`);  break;"
+            "case '3':  return (`other`);  break;case '4':  return (`same`);  break;default:  "
+            "return (`default value`);  break;};})()",
+        ),
+        (
+            (
+                (1, "x"),
+                (2, Var.create("x", _var_is_string=False)),
+                (3, Var.create("d", _var_is_string=False)),
+                "d",
+            ),
+            "(() => { switch (JSON.stringify(match_state.value)) {case '1':  return (`x`);  break;"
+            "case '2':  return (x);  break;case '3':  return (d);  break;default:  "
+            "return (`d`);  break;};})()",
+        ),
     ],
 )
 def test_match_vars(cases, expected):
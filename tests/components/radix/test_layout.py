@@ -1,6 +1,14 @@
 from reflex.components.radix.themes.layout.base import LayoutComponent
+from reflex.components.radix.themes.layout.grid import Grid
 
 
 def test_layout_component():
     lc = LayoutComponent.create()
     assert isinstance(lc, LayoutComponent)
+
+
+def test_grid_renames_spacing_props():
+    props = Grid.create(spacing="2", spacing_x="3", spacing_y="4").render()["props"]
+    assert "gap={`2`}" in props
+    assert "gapX={`3`}" in props
+    assert "gapY={`4`}" in props
@@ -1,6 +1,9 @@
-from typing import Any, Dict, List, Type
+import functools
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 import pytest
+from pydantic import ValidationError
 
 import reflex as rx
 from reflex.base import Base
@@ -13,6 +16,7 @@ from reflex.components.component import (
     StatefulComponent,
     custom_component,
 )
+from reflex.components.radix.themes.typography.text import Text
 from reflex.constants import EventTriggers
 from reflex.event import EventChain, EventHandler
 from reflex.state import BaseState
@@ -21,8 +25,57 @@ from reflex.utils import imports
 from reflex.utils.imports import ImportVar
 from reflex.vars import Var, VarData
 
+# The event triggers every component supports.
+_DEFAULT_TRIGGERS = frozenset(
+    {
+        EventTriggers.ON_FOCUS,
+        EventTriggers.ON_BLUR,
+        EventTriggers.ON_CLICK,
+        EventTriggers.ON_CONTEXT_MENU,
+        EventTriggers.ON_DOUBLE_CLICK,
+        EventTriggers.ON_MOUSE_DOWN,
+        EventTriggers.ON_MOUSE_ENTER,
+        EventTriggers.ON_MOUSE_LEAVE,
+        EventTriggers.ON_MOUSE_MOVE,
+        EventTriggers.ON_MOUSE_OUT,
+        EventTriggers.ON_MOUSE_OVER,
+        EventTriggers.ON_MOUSE_UP,
+        EventTriggers.ON_SCROLL,
+        EventTriggers.ON_MOUNT,
+        EventTriggers.ON_UNMOUNT,
+    }
+)
 
-@pytest.fixture
+# These components all have required arguments and cannot be trivially instantiated.
+_UNTESTED_COMPONENTS = frozenset(
+    {
+        "Card",
+        "Cond",
+        "DebounceInput",
+        "Foreach",
+        "FormControl",
+        "Html",
+        "Icon",
+        "Match",
+        "Markdown",
+        "MultiSelect",
+        "Option",
+        "Popover",
+        "Radio",
+        "Script",
+        "Tag",
+        "Tfoot",
+        "Thead",
+    }
+)
+
+
+# Styles applied by the add_style tests; _add_style_recursive copies them.
+_WHITE = Style({"color": "white"})
+_BLACK = Style({"color": "black"})
+
+
+@pytest.fixture(scope="module")
 def test_state():
     class TestState(BaseState):
         num: int
@@ -36,7 +89,7 @@ def test_state():
     return TestState
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def component1() -> Type[Component]:
     """A test component.
 
@@ -60,7 +113,7 @@ def component1() -> Type[Component]:
     return TestComponent1
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def component2() -> Type[Component]:
     """A test component.
 
@@ -93,7 +146,7 @@ def component2() -> Type[Component]:
     return TestComponent2
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def component3() -> Type[Component]:
     """A test component with hook defined.
 
@@ -108,7 +161,7 @@ def component3() -> Type[Component]:
     return TestComponent3
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def component4() -> Type[Component]:
     """A test component with hook defined.
 
@@ -123,87 +176,104 @@ def component4() -> Type[Component]:
     return TestComponent4
 
 
-@pytest.fixture
-def component5() -> Type[Component]:
-    """A test component.
+@pytest.fixture(scope="module")
+def component3_hooks(component3) -> Dict[str, None]:
+    """The hooks of a single component3 instance.
+
+    Args:
+        component3: component with hooks defined.
 
     Returns:
-        A test component.
+        The hooks of the component.
     """
+    return component3()._get_all_hooks()
 
-    class TestComponent5(Component):
-        tag = "RandomComponent"
-
-        _invalid_children: List[str] = ["Text"]
-
-        _valid_children: List[str] = ["Text"]
 
-        _valid_parents: List[str] = ["Text"]
+@pytest.fixture(scope="module")
+def component4_hooks(component4) -> Dict[str, None]:
+    """The hooks of a single component4 instance.
 
-    return TestComponent5
-
-
-@pytest.fixture
-def component6() -> Type[Component]:
-    """A test component.
+    Args:
+        component4: component with different hooks defined.
 
     Returns:
-        A test component.
+        The hooks of the component.
     """
+    return component4()._get_all_hooks()
 
-    class TestComponent6(Component):
-        tag = "RandomComponent"
 
-        _invalid_children: List[str] = ["Text"]
+# Child/parent constraints as (name, _invalid_children, _valid_children, _valid_parents).
+INVALID_CHILDREN = ("invalid", ("Text",), None, None)
+VALID_CHILDREN = ("valid", None, ("Text",), None)
+ALL_CONSTRAINTS = ("both", ("Text",), ("Text",), ("Text",))
 
-    return TestComponent6
+# Component classes built for each set of constraints.
+_constrained_components: Dict[tuple, Type[Component]] = {}
 
 
-@pytest.fixture
-def component7() -> Type[Component]:
-    """A test component.
+@pytest.fixture(
+    scope="module",
+    params=[INVALID_CHILDREN, VALID_CHILDREN, ALL_CONSTRAINTS],
+    ids=["c6", "c7", "c5"],
+)
+def component_with_constraints(request) -> Type[Component]:
+    """A test component with child and parent constraints.
+
+    Args:
+        request: Pytest request, whose param holds the constraints.
 
     Returns:
         A test component.
     """
+    constraints = request.param
+    if constraints not in _constrained_components:
+        name, invalid_children, valid_children, valid_parents = constraints
+        namespace: Dict[str, Any] = {"tag": "RandomComponent"}
+        if invalid_children is not None:
+            namespace["_invalid_children"] = list(invalid_children)
+        if valid_children is not None:
+            namespace["_valid_children"] = list(valid_children)
+        if valid_parents is not None:
+            namespace["_valid_parents"] = list(valid_parents)
+        _constrained_components[constraints] = type(
+            f"TestComponent{name.capitalize()}", (Component,), namespace
+        )
+    return _constrained_components[constraints]
 
-    class TestComponent7(Component):
-        tag = "RandomComponent"
 
-        _valid_children: List[str] = ["Text"]
+def _noop1():
+    pass
 
-    return TestComponent7
 
+def _noop2():
+    pass
 
-@pytest.fixture
+
+_ON_CLICK1 = EventHandler(fn=_noop1)
+_ON_CLICK2 = EventHandler(fn=_noop2)
+
+
+@pytest.fixture(scope="module")
 def on_click1() -> EventHandler:
     """A sample on click function.
 
     Returns:
         A sample on click function.
     """
-
-    def on_click1():
-        pass
-
-    return EventHandler(fn=on_click1)
+    return _ON_CLICK1
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def on_click2() -> EventHandler:
     """A sample on click function.
 
     Returns:
         A sample on click function.
     """
+    return _ON_CLICK2
 
-    def on_click2():
-        pass
 
-    return EventHandler(fn=on_click2)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def my_component():
     """A test component function.
 
@@ -260,8 +330,8 @@ def test_add_style(component1, component2):
         component2: A test component.
     """
     style = {
-        component1: Style({"color": "white"}),
-        component2: Style({"color": "black"}),
+        component1: _WHITE,
+        component2: _BLACK,
     }
     c1 = component1()._add_style_recursive(style)  # type: ignore
     c2 = component2()._add_style_recursive(style)  # type: ignore
@@ -277,8 +347,8 @@ def test_add_style_create(component1, component2):
         component2: A test component.
     """
     style = {
-        component1.create: Style({"color": "white"}),
-        component2.create: Style({"color": "black"}),
+        component1.create: _WHITE,
+        component2.create: _BLACK,
     }
     c1 = component1()._add_style_recursive(style)  # type: ignore
     c2 = component2()._add_style_recursive(style)  # type: ignore
@@ -341,23 +411,37 @@ def test_get_props(component1, component2):
     assert component2.get_props() == {"arr"}
 
 
+@pytest.fixture
+def valid_props_case(request, component1) -> Tuple[Component, str, int]:
+    """A component1 instance created from the requested props.
+
+    Args:
+        request: Pytest request, whose param holds the text and number props.
+        component1: A test component.
+
+    Returns:
+        The component along with the text and number it was created with.
+    """
+    text, number = request.param
+    return component1.create(text=text, number=number), text, number
+
+
 @pytest.mark.parametrize(
-    "text,number",
+    "valid_props_case",
     [
         ("", 0),
         ("test", 1),
         ("hi", -13),
     ],
+    indirect=True,
 )
-def test_valid_props(component1, text: str, number: int):
+def test_valid_props(valid_props_case):
     """Test that we can construct a component with valid props.
 
     Args:
-        component1: A test component.
-        text: A test string.
-        number: A test number.
+        valid_props_case: A test component and the props it was created with.
     """
-    c = component1.create(text=text, number=number)
+    c, text, number = valid_props_case
     assert c.text._decode() == text
     assert c.number._decode() == number
 
@@ -396,31 +480,14 @@ def test_get_event_triggers(component1, component2):
         component1: A test component.
         component2: A test component.
     """
-    default_triggers = {
-        EventTriggers.ON_FOCUS,
-        EventTriggers.ON_BLUR,
-        EventTriggers.ON_CLICK,
-        EventTriggers.ON_CONTEXT_MENU,
-        EventTriggers.ON_DOUBLE_CLICK,
-        EventTriggers.ON_MOUSE_DOWN,
-        EventTriggers.ON_MOUSE_ENTER,
-        EventTriggers.ON_MOUSE_LEAVE,
-        EventTriggers.ON_MOUSE_MOVE,
-        EventTriggers.ON_MOUSE_OUT,
-        EventTriggers.ON_MOUSE_OVER,
-        EventTriggers.ON_MOUSE_UP,
-        EventTriggers.ON_SCROLL,
-        EventTriggers.ON_MOUNT,
-        EventTriggers.ON_UNMOUNT,
-    }
-    assert set(component1().get_event_triggers().keys()) == default_triggers
+    assert component1().get_event_triggers().keys() == _DEFAULT_TRIGGERS
     assert (
         component2().get_event_triggers().keys()
-        == {"on_open", "on_close"} | default_triggers
+        == {"on_open", "on_close"} | _DEFAULT_TRIGGERS
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_component() -> Type[Component]:
     """A test component.
 
@@ -465,32 +532,56 @@ class C1State(BaseState):
         pass
 
 
-def test_component_event_trigger_arbitrary_args():
-    """Test that we can define arbitrary types for the args of an event trigger."""
+class Obj(Base):
+    """A custom type used as an event trigger arg."""
 
-    class Obj(Base):
-        custom: int = 0
+    custom: int = 0
 
-    def on_foo_spec(_e, alpha: str, bravo: Dict[str, Any], charlie: Obj):
-        return [_e.target.value, bravo["nested"], charlie.custom + 42]
 
-    class C1(Component):
-        library = "/local"
-        tag = "C1"
+def on_foo_spec(_e, alpha: str, bravo: Dict[str, Any], charlie: Obj):
+    """Event trigger spec with arbitrary arg types.
 
-        def get_event_triggers(self) -> Dict[str, Any]:
-            return {
-                **super().get_event_triggers(),
-                "on_foo": on_foo_spec,
-            }
+    Args:
+        _e: The event.
+        alpha: A string arg.
+        bravo: A dict arg.
+        charlie: A custom type arg.
 
-    comp = C1.create(on_foo=C1State.mock_handler)
+    Returns:
+        The args to pass to the event handler.
+    """
+    return [_e.target.value, bravo["nested"], charlie.custom + 42]
 
-    assert comp.render()["props"][0] == (
-        "onFoo={(__e,_alpha,_bravo,_charlie) => addEvents("
-        '[Event("c1_state.mock_handler", {_e:__e.target.value,_bravo:_bravo["nested"],_charlie:((_charlie.custom) + (42))})], '
-        "(__e,_alpha,_bravo,_charlie), {})}"
-    )
+
+class C1(Component):
+    """A component with an event trigger taking arbitrary args."""
+
+    library = "/local"
+    tag = "C1"
+
+    def get_event_triggers(self) -> Dict[str, Any]:
+        """Add the on_foo trigger.
+
+        Returns:
+            The event triggers.
+        """
+        return {
+            **super().get_event_triggers(),
+            "on_foo": on_foo_spec,
+        }
+
+
+_C1_RENDER_EXPECTED = (
+    "onFoo={(__e,_alpha,_bravo,_charlie) => addEvents("
+    '[Event("c1_state.mock_handler", {_e:__e.target.value,_bravo:_bravo["nested"],_charlie:((_charlie.custom) + (42))})], '
+    "(__e,_alpha,_bravo,_charlie), {})}"
+)
+
+
+def test_component_event_trigger_arbitrary_args():
+    """Test that we can define arbitrary types for the args of an event trigger."""
+    comp = C1.create(on_foo=C1State.mock_handler)
+    assert comp.render()["props"][0] == _C1_RENDER_EXPECTED
 
 
 def test_create_custom_component(my_component):
@@ -505,6 +596,18 @@ def test_create_custom_component(my_component):
     assert component._get_all_custom_components() == {component}
 
 
+def test_custom_component_get_all_custom_components_fresh_set(my_component):
+    """Test that mutating the returned custom components does not affect later calls.
+
+    Args:
+        my_component: A test custom component.
+    """
+    component = CustomComponent(component_fn=my_component, prop1="test", prop2=1)
+    custom_components = component._get_all_custom_components()
+    custom_components.clear()
+    assert component._get_all_custom_components() == {component}
+
+
 def test_custom_component_hash(my_component):
     """Test that the hash of a custom component is correct.
 
@@ -526,8 +629,6 @@ def test_custom_component_wrapper():
             color=color,
         )
 
-    from reflex.components.radix.themes.typography.text import Text
-
     ccomponent = my_component(
         rx.text("child"), width=Var.create(1), color=Var.create("red")
     )
@@ -552,7 +653,9 @@ def test_invalid_event_handler_args(component2, test_state):
     # This is not okay.
     with pytest.raises(ValueError):
         component2.create(on_click=test_state.do_something_arg)
+    with pytest.raises(ValueError):
         component2.create(on_open=test_state.do_something)
+    with pytest.raises(ValueError):
         component2.create(
             on_open=[test_state.do_something_arg, test_state.do_something]
         )
@@ -570,13 +673,14 @@ def test_invalid_event_handler_args(component2, test_state):
     component2.create(on_open=test_state.do_something_arg)
 
 
-def test_get_hooks_nested(component1, component2, component3):
+def test_get_hooks_nested(component1, component2, component3, component3_hooks):
     """Test that a component returns hooks from child components.
 
     Args:
         component1: test component.
         component2: another component.
         component3: component with hooks defined.
+        component3_hooks: the hooks of component3.
     """
     c = component1.create(
         component2.create(arr=[]),
@@ -586,17 +690,19 @@ def test_get_hooks_nested(component1, component2, component3):
         text="a",
         number=1,
     )
-    assert c._get_all_hooks() == component3()._get_all_hooks()
+    assert c._get_all_hooks() == component3_hooks
 
 
-def test_get_hooks_nested2(component3, component4):
+def test_get_hooks_nested2(component3, component4, component3_hooks, component4_hooks):
     """Test that a component returns both when parent and child have hooks.
 
     Args:
         component3: component with hooks defined.
         component4: component with different hooks defined.
+        component3_hooks: the hooks of component3.
+        component4_hooks: the hooks of component4.
     """
-    exp_hooks = {**component3()._get_all_hooks(), **component4()._get_all_hooks()}
+    exp_hooks = {**component3_hooks, **component4_hooks}
     assert component3.create(component4.create())._get_all_hooks() == exp_hooks
     assert component4.create(component3.create())._get_all_hooks() == exp_hooks
     assert (
@@ -609,52 +715,62 @@ def test_get_hooks_nested2(component3, component4):
     )
 
 
-@pytest.mark.parametrize("fixture", ["component5", "component6"])
-def test_unsupported_child_components(fixture, request):
+@pytest.mark.parametrize(
+    "component_with_constraints",
+    [ALL_CONSTRAINTS, INVALID_CHILDREN],
+    ids=["c5", "c6"],
+    indirect=True,
+)
+def test_unsupported_child_components(component_with_constraints):
     """Test that a value error is raised when an unsupported component (a child component found in the
     component's invalid children list) is provided as a child.
 
     Args:
-        fixture: the test component as a fixture.
-        request: Pytest request.
+        component_with_constraints: the test component with invalid children.
     """
-    component = request.getfixturevalue(fixture)
+    component = component_with_constraints
     with pytest.raises(ValueError) as err:
-        comp = component.create(rx.text("testing component"))
-        comp.render()
+        component.create(rx.text("testing component"))
     assert (
         err.value.args[0]
         == f"The component `{component.__name__}` cannot have `Text` as a child component"
     )
 
 
-def test_unsupported_parent_components(component5):
+@pytest.mark.parametrize(
+    "component_with_constraints", [ALL_CONSTRAINTS], ids=["c5"], indirect=True
+)
+def test_unsupported_parent_components(component_with_constraints):
     """Test that a value error is raised when an component is not in _valid_parents of one of its children.
 
     Args:
-        component5: component with valid parent of "Text" only
+        component_with_constraints: component with valid parent of "Text" only
     """
+    component = component_with_constraints
     with pytest.raises(ValueError) as err:
-        rx.box(component5.create())
+        rx.box(component.create())
     assert (
         err.value.args[0]
-        == f"The component `{component5.__name__}` can only be a child of the components: `{component5._valid_parents[0]}`. Got `Box` instead."
+        == f"The component `{component.__name__}` can only be a child of the components: `{component._valid_parents[0]}`. Got `Box` instead."
     )
 
 
-@pytest.mark.parametrize("fixture", ["component5", "component7"])
-def test_component_with_only_valid_children(fixture, request):
+@pytest.mark.parametrize(
+    "component_with_constraints",
+    [ALL_CONSTRAINTS, VALID_CHILDREN],
+    ids=["c5", "c7"],
+    indirect=True,
+)
+def test_component_with_only_valid_children(component_with_constraints):
     """Test that a value error is raised when an unsupported component (a child component not found in the
     component's valid children list) is provided as a child.
 
     Args:
-        fixture: the test component as a fixture.
-        request: Pytest request.
+        component_with_constraints: the test component with valid children.
     """
-    component = request.getfixturevalue(fixture)
+    component = component_with_constraints
     with pytest.raises(ValueError) as err:
-        comp = component.create(rx.box("testing component"))
-        comp.render()
+        component.create(rx.box("testing component"))
     assert (
         err.value.args[0]
         == f"The component `{component.__name__}` only allows the components: `Text` as children. "
@@ -682,19 +798,45 @@ def test_format_component(component, rendered):
     assert str(component) == rendered
 
 
-def test_stateful_component(test_state):
-    """Test that a stateful component is created correctly.
+@pytest.fixture
+def text_num(test_state) -> Component:
+    """A text component rendering a state var.
 
     Args:
         test_state: A test state.
+
+    Returns:
+        A text component.
     """
-    text_component = rx.text(test_state.num)
-    stateful_component = StatefulComponent.compile_from(text_component)
+    return rx.text(test_state.num)
+
+
+@pytest.fixture
+def text_num_twin(test_state) -> Component:
+    """A second text component identical to text_num.
+
+    Args:
+        test_state: A test state.
+
+    Returns:
+        A text component.
+    """
+    return rx.text(test_state.num)
+
+
+def test_stateful_component(text_num, text_num_twin):
+    """Test that a stateful component is created correctly.
+
+    Args:
+        text_num: A text component rendering a state var.
+        text_num_twin: An identical text component.
+    """
+    stateful_component = StatefulComponent.compile_from(text_num)
     assert isinstance(stateful_component, StatefulComponent)
     assert stateful_component.tag is not None
     assert stateful_component.tag.startswith("Text_")
     assert stateful_component.references == 1
-    sc2 = StatefulComponent.compile_from(rx.text(test_state.num))
+    sc2 = StatefulComponent.compile_from(text_num_twin)
     assert isinstance(sc2, StatefulComponent)
     assert stateful_component.references == 2
     assert sc2.references == 2
@@ -736,33 +878,54 @@ STYLE_VAR = TEST_VAR._replace(_var_name="style", _var_is_local=False)
 EVENT_CHAIN_VAR = TEST_VAR._replace(_var_type=EventChain)
 ARG_VAR = Var.create("arg")
 
-TEST_VAR_DICT_OF_DICT = Var.create_safe({"a": {"b": "test"}})._replace(
-    merge_var_data=TEST_VAR._var_data
-)
-FORMATTED_TEST_VAR_DICT_OF_DICT = Var.create_safe({"a": {"b": f"footestbar"}})._replace(
-    merge_var_data=TEST_VAR._var_data
-)
+# The nested Vars below are only needed by a few test_get_vars cases, so they
+# are built on first use instead of at import time.
+@functools.lru_cache(maxsize=None)
+def _test_var_dict_of_dict() -> Var:
+    return Var.create_safe({"a": {"b": "test"}})._replace(
+        merge_var_data=TEST_VAR._var_data
+    )
 
-TEST_VAR_LIST_OF_LIST = Var.create_safe([["test"]])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
-FORMATTED_TEST_VAR_LIST_OF_LIST = Var.create_safe([["footestbar"]])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
 
-TEST_VAR_LIST_OF_LIST_OF_LIST = Var.create_safe([[["test"]]])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
-FORMATTED_TEST_VAR_LIST_OF_LIST_OF_LIST = Var.create_safe([[["footestbar"]]])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
+@functools.lru_cache(maxsize=None)
+def _formatted_test_var_dict_of_dict() -> Var:
+    return Var.create_safe({"a": {"b": "footestbar"}})._replace(
+        merge_var_data=TEST_VAR._var_data
+    )
 
-TEST_VAR_LIST_OF_DICT = Var.create_safe([{"a": "test"}])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
-FORMATTED_TEST_VAR_LIST_OF_DICT = Var.create_safe([{"a": "footestbar"}])._replace(
-    merge_var_data=TEST_VAR._var_data
-)
+
+@functools.lru_cache(maxsize=None)
+def _test_var_list_of_list() -> Var:
+    return Var.create_safe([["test"]])._replace(merge_var_data=TEST_VAR._var_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _formatted_test_var_list_of_list() -> Var:
+    return Var.create_safe([["footestbar"]])._replace(merge_var_data=TEST_VAR._var_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _test_var_list_of_list_of_list() -> Var:
+    return Var.create_safe([[["test"]]])._replace(merge_var_data=TEST_VAR._var_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _formatted_test_var_list_of_list_of_list() -> Var:
+    return Var.create_safe([[["footestbar"]]])._replace(
+        merge_var_data=TEST_VAR._var_data
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _test_var_list_of_dict() -> Var:
+    return Var.create_safe([{"a": "test"}])._replace(merge_var_data=TEST_VAR._var_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _formatted_test_var_list_of_dict() -> Var:
+    return Var.create_safe([{"a": "footestbar"}])._replace(
+        merge_var_data=TEST_VAR._var_data
+    )
 
 
 class ComponentNestedVar(Component):
@@ -790,205 +953,230 @@ class EventState(rx.State):
         """
 
 
+def _var_key(var: Var) -> tuple:
+    """Get a hashable key that compares the same way as `Var.equals`.
+
+    Args:
+        var: The var to get the key for.
+
+    Returns:
+        The key for the var.
+    """
+    var_data = var._var_data
+    if var_data is not None:
+        var_data = (
+            var_data.state,
+            frozenset(var_data.hooks),
+            frozenset(
+                (lib, frozenset(fields))
+                for lib, fields in imports.collapse_imports(var_data.imports).items()
+            ),
+        )
+    return (
+        var._var_name,
+        var._var_type,
+        var._var_is_local,
+        var._var_full_name_needs_state_prefix,
+        var_data,
+    )
+
+
 @pytest.mark.parametrize(
     ("component", "exp_vars"),
     (
         pytest.param(
-            Bare.create(TEST_VAR),
+            lambda: Bare.create(TEST_VAR),
             [TEST_VAR],
             id="direct-bare",
         ),
         pytest.param(
-            Bare.create(f"foo{TEST_VAR}bar"),
+            lambda: Bare.create(f"foo{TEST_VAR}bar"),
             [FORMATTED_TEST_VAR],
             id="fstring-bare",
         ),
         pytest.param(
-            rx.text(as_=TEST_VAR),
+            lambda: rx.text(as_=TEST_VAR),
             [TEST_VAR],
             id="direct-prop",
         ),
         pytest.param(
-            rx.heading(as_=f"foo{TEST_VAR}bar"),
+            lambda: rx.heading(as_=f"foo{TEST_VAR}bar"),
             [FORMATTED_TEST_VAR],
             id="fstring-prop",
         ),
         pytest.param(
-            rx.fragment(id=TEST_VAR),
+            lambda: rx.fragment(id=TEST_VAR),
             [TEST_VAR],
             id="direct-id",
         ),
         pytest.param(
-            rx.fragment(id=f"foo{TEST_VAR}bar"),
+            lambda: rx.fragment(id=f"foo{TEST_VAR}bar"),
             [FORMATTED_TEST_VAR],
             id="fstring-id",
         ),
         pytest.param(
-            rx.fragment(key=TEST_VAR),
+            lambda: rx.fragment(key=TEST_VAR),
             [TEST_VAR],
             id="direct-key",
         ),
         pytest.param(
-            rx.fragment(key=f"foo{TEST_VAR}bar"),
+            lambda: rx.fragment(key=f"foo{TEST_VAR}bar"),
             [FORMATTED_TEST_VAR],
             id="fstring-key",
         ),
         pytest.param(
-            rx.fragment(class_name=TEST_VAR),
+            lambda: rx.fragment(class_name=TEST_VAR),
             [TEST_VAR],
             id="direct-class_name",
         ),
         pytest.param(
-            rx.fragment(class_name=f"foo{TEST_VAR}bar"),
+            lambda: rx.fragment(class_name=f"foo{TEST_VAR}bar"),
             [FORMATTED_TEST_VAR],
             id="fstring-class_name",
         ),
         pytest.param(
-            rx.fragment(special_props={TEST_VAR}),
+            lambda: rx.fragment(special_props={TEST_VAR}),
             [TEST_VAR],
             id="direct-special_props",
         ),
         pytest.param(
-            rx.fragment(special_props={Var.create(f"foo{TEST_VAR}bar")}),
+            lambda: rx.fragment(special_props={Var.create(f"foo{TEST_VAR}bar")}),
             [FORMATTED_TEST_VAR],
             id="fstring-special_props",
         ),
         pytest.param(
             # custom_attrs cannot accept a Var directly as a value
-            rx.fragment(custom_attrs={"href": f"{TEST_VAR}"}),
+            lambda: rx.fragment(custom_attrs={"href": f"{TEST_VAR}"}),
             [TEST_VAR],
             id="fstring-custom_attrs-nofmt",
         ),
         pytest.param(
-            rx.fragment(custom_attrs={"href": f"foo{TEST_VAR}bar"}),
+            lambda: rx.fragment(custom_attrs={"href": f"foo{TEST_VAR}bar"}),
             [FORMATTED_TEST_VAR],
             id="fstring-custom_attrs",
         ),
         pytest.param(
-            rx.fragment(background_color=TEST_VAR),
+            lambda: rx.fragment(background_color=TEST_VAR),
             [STYLE_VAR],
             id="direct-background_color",
         ),
         pytest.param(
-            rx.fragment(background_color=f"foo{TEST_VAR}bar"),
+            lambda: rx.fragment(background_color=f"foo{TEST_VAR}bar"),
             [STYLE_VAR],
             id="fstring-background_color",
         ),
         pytest.param(
-            rx.fragment(style={"background_color": TEST_VAR}),  # type: ignore
+            lambda: rx.fragment(style={"background_color": TEST_VAR}),  # type: ignore
             [STYLE_VAR],
             id="direct-style-background_color",
         ),
         pytest.param(
-            rx.fragment(style={"background_color": f"foo{TEST_VAR}bar"}),  # type: ignore
+            lambda: rx.fragment(style={"background_color": f"foo{TEST_VAR}bar"}),  # type: ignore
             [STYLE_VAR],
             id="fstring-style-background_color",
         ),
         pytest.param(
-            rx.fragment(on_click=EVENT_CHAIN_VAR),  # type: ignore
+            lambda: rx.fragment(on_click=EVENT_CHAIN_VAR),  # type: ignore
             [EVENT_CHAIN_VAR],
             id="direct-event-chain",
         ),
         pytest.param(
-            rx.fragment(on_click=EventState.handler),
+            lambda: rx.fragment(on_click=EventState.handler),
             [],
             id="direct-event-handler",
         ),
         pytest.param(
-            rx.fragment(on_click=EventState.handler2(TEST_VAR)),  # type: ignore
+            lambda: rx.fragment(on_click=EventState.handler2(TEST_VAR)),  # type: ignore
             [ARG_VAR, TEST_VAR],
             id="direct-event-handler-arg",
         ),
         pytest.param(
-            rx.fragment(on_click=EventState.handler2(EventState.v)),  # type: ignore
+            lambda: rx.fragment(on_click=EventState.handler2(EventState.v)),  # type: ignore
             [ARG_VAR, EventState.v],
             id="direct-event-handler-arg2",
         ),
         pytest.param(
-            rx.fragment(on_click=lambda: EventState.handler2(TEST_VAR)),  # type: ignore
+            lambda: rx.fragment(on_click=lambda: EventState.handler2(TEST_VAR)),  # type: ignore
             [ARG_VAR, TEST_VAR],
             id="direct-event-handler-lambda",
         ),
         pytest.param(
-            ComponentNestedVar.create(dict_of_dict={"a": {"b": TEST_VAR}}),
-            [TEST_VAR_DICT_OF_DICT],
+            lambda: ComponentNestedVar.create(dict_of_dict={"a": {"b": TEST_VAR}}),
+            [_test_var_dict_of_dict],
             id="direct-dict_of_dict",
         ),
         pytest.param(
-            ComponentNestedVar.create(dict_of_dict={"a": {"b": f"foo{TEST_VAR}bar"}}),
-            [FORMATTED_TEST_VAR_DICT_OF_DICT],
+            lambda: ComponentNestedVar.create(
+                dict_of_dict={"a": {"b": f"foo{TEST_VAR}bar"}}
+            ),
+            [_formatted_test_var_dict_of_dict],
             id="fstring-dict_of_dict",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_list=[[TEST_VAR]]),
-            [TEST_VAR_LIST_OF_LIST],
+            lambda: ComponentNestedVar.create(list_of_list=[[TEST_VAR]]),
+            [_test_var_list_of_list],
             id="direct-list_of_list",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_list=[[f"foo{TEST_VAR}bar"]]),
-            [FORMATTED_TEST_VAR_LIST_OF_LIST],
+            lambda: ComponentNestedVar.create(list_of_list=[[f"foo{TEST_VAR}bar"]]),
+            [_formatted_test_var_list_of_list],
             id="fstring-list_of_list",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_list_of_list=[[[TEST_VAR]]]),
-            [TEST_VAR_LIST_OF_LIST_OF_LIST],
+            lambda: ComponentNestedVar.create(list_of_list_of_list=[[[TEST_VAR]]]),
+            [_test_var_list_of_list_of_list],
             id="direct-list_of_list_of_list",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_list_of_list=[[[f"foo{TEST_VAR}bar"]]]),
-            [FORMATTED_TEST_VAR_LIST_OF_LIST_OF_LIST],
+            lambda: ComponentNestedVar.create(
+                list_of_list_of_list=[[[f"foo{TEST_VAR}bar"]]]
+            ),
+            [_formatted_test_var_list_of_list_of_list],
             id="fstring-list_of_list_of_list",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_dict=[{"a": TEST_VAR}]),
-            [TEST_VAR_LIST_OF_DICT],
+            lambda: ComponentNestedVar.create(list_of_dict=[{"a": TEST_VAR}]),
+            [_test_var_list_of_dict],
             id="direct-list_of_dict",
         ),
         pytest.param(
-            ComponentNestedVar.create(list_of_dict=[{"a": f"foo{TEST_VAR}bar"}]),
-            [FORMATTED_TEST_VAR_LIST_OF_DICT],
+            lambda: ComponentNestedVar.create(
+                list_of_dict=[{"a": f"foo{TEST_VAR}bar"}]
+            ),
+            [_formatted_test_var_list_of_dict],
             id="fstring-list_of_dict",
         ),
     ),
 )
 def test_get_vars(component, exp_vars):
-    comp_vars = sorted(component._get_vars(), key=lambda v: v._var_name)
-    assert len(comp_vars) == len(exp_vars)
-    for comp_var, exp_var in zip(
-        comp_vars,
-        sorted(exp_vars, key=lambda v: v._var_name),
-    ):
-        assert comp_var.equals(exp_var)
+    component = component()
+    exp_vars = [var if isinstance(var, Var) else var() for var in exp_vars]
+    assert Counter(map(_var_key, component._get_vars())) == Counter(
+        map(_var_key, exp_vars)
+    )
 
 
-def test_instantiate_all_components():
-    """Test that all components can be instantiated."""
-    # These components all have required arguments and cannot be trivially instantiated.
-    untested_components = {
-        "Card",
-        "Cond",
-        "DebounceInput",
-        "Foreach",
-        "FormControl",
-        "Html",
-        "Icon",
-        "Match",
-        "Markdown",
-        "MultiSelect",
-        "Option",
-        "Popover",
-        "Radio",
-        "Script",
-        "Tag",
-        "Tfoot",
-        "Thead",
-    }
+@functools.lru_cache(maxsize=1)
+def _instantiable_components() -> Tuple[Type[Component], ...]:
+    """Resolve the component classes exported by reflex that take no required args.
+
+    Returns:
+        The component classes to instantiate.
+    """
+    components = []
     for component_name in rx._ALL_COMPONENTS:  # type: ignore
-        if component_name in untested_components:
+        if component_name in _UNTESTED_COMPONENTS:
             continue
         component = getattr(rx, component_name)
         if isinstance(component, type) and issubclass(component, Component):
-            component.create()
+            components.append(component)
+    return tuple(components)
+
+
+def test_instantiate_all_components():
+    """Test that all components can be instantiated."""
+    for component in _instantiable_components():
+        component.create()
 
 
 class InvalidParentComponent(Component):
@@ -1050,7 +1238,7 @@ def test_validate_valid_children():
 
     valid_component1(
         rx.cond(  # type: ignore
-            True,
+            Var.create(True),
             rx.fragment(valid_component2()),
             rx.fragment(
                 rx.foreach(Var.create([1, 2, 3]), lambda x: valid_component2(x))  # type: ignore
@@ -1060,7 +1248,7 @@ def test_validate_valid_children():
 
     valid_component1(
         rx.cond(
-            True,
+            Var.create(True),
             valid_component2(),
             rx.fragment(
                 rx.match(
@@ -1079,7 +1267,11 @@ def test_validate_valid_children():
             ("second", "third", rx.fragment(valid_component2())),
             (
                 "fourth",
-                rx.cond(True, valid_component2(), rx.fragment(valid_component2())),
+                rx.cond(
+                    Var.create(True),
+                    valid_component2(),
+                    rx.fragment(valid_component2()),
+                ),
             ),
             (
                 "fifth",
@@ -1094,6 +1286,24 @@ def test_validate_valid_children():
     )
 
 
+def test_validate_wrapper_subclass_is_constrained():
+    """Test that subclasses of the wrapper components are not exempt from constraints."""
+    from reflex.app import OverlayFragment
+    from reflex.components.base.fragment import Fragment
+
+    class MyFragment(Fragment):
+        pass
+
+    with pytest.raises(ValueError):
+        valid_component1(MyFragment.create(valid_component2()))
+
+    with pytest.raises(ValueError):
+        valid_component1(OverlayFragment.create(valid_component2()))
+
+    # The wrapper classes themselves are still exempt.
+    valid_component1(rx.fragment(valid_component2()))
+
+
 def test_validate_valid_parents():
     valid_component2(valid_component3())
     valid_component2(
@@ -1109,7 +1319,7 @@ def test_validate_valid_parents():
 
     valid_component2(
         rx.cond(  # type: ignore
-            True,
+            Var.create(True),
             rx.fragment(valid_component3()),
             rx.fragment(
                 rx.foreach(
@@ -1122,7 +1332,7 @@ def test_validate_valid_parents():
 
     valid_component2(
         rx.cond(
-            True,
+            Var.create(True),
             valid_component3(),
             rx.fragment(
                 rx.match(
@@ -1141,7 +1351,11 @@ def test_validate_valid_parents():
             ("second", "third", rx.fragment(valid_component3())),
             (
                 "fourth",
-                rx.cond(True, valid_component3(), rx.fragment(valid_component3())),
+                rx.cond(
+                    Var.create(True),
+                    valid_component3(),
+                    rx.fragment(valid_component3()),
+                ),
             ),
             (
                 "fifth",
@@ -1156,39 +1370,42 @@ def test_validate_valid_parents():
     )
 
 
-def test_validate_invalid_children():
-    with pytest.raises(ValueError):
-        valid_component4(invalid_component())
+def _assert_invalid_trees(*tree_factories: Callable[[], Component]):
+    """Assert that building each component tree fails validation.
 
-    with pytest.raises(ValueError):
-        valid_component4(
-            rx.fragment(invalid_component()),
-        )
+    Args:
+        *tree_factories: Functions that build the component trees.
+    """
+    for tree_factory in tree_factories:
+        with pytest.raises(ValueError):
+            tree_factory()
 
-    with pytest.raises(ValueError):
-        valid_component2(
+
+def test_validate_invalid_children():
+    _assert_invalid_trees(
+        lambda: valid_component4(invalid_component()),
+        lambda: valid_component4(
+            rx.fragment(invalid_component()),
+        ),
+        lambda: valid_component2(
             rx.fragment(
                 valid_component4(
                     rx.fragment(invalid_component()),
                 ),
             ),
-        )
-
-    with pytest.raises(ValueError):
-        valid_component4(
+        ),
+        lambda: valid_component4(
             rx.cond(  # type: ignore
-                True,
+                Var.create(True),
                 rx.fragment(invalid_component()),
                 rx.fragment(
                     rx.foreach(Var.create([1, 2, 3]), lambda x: invalid_component(x))  # type: ignore
                 ),
             )
-        )
-
-    with pytest.raises(ValueError):
-        valid_component4(
+        ),
+        lambda: valid_component4(
             rx.cond(
-                True,
+                Var.create(True),
                 invalid_component(),
                 rx.fragment(
                     rx.match(
@@ -1198,17 +1415,19 @@ def test_validate_invalid_children():
                     )
                 ),
             )
-        )
-
-    with pytest.raises(ValueError):
-        valid_component4(
+        ),
+        lambda: valid_component4(
             rx.match(
                 "condition",
                 ("first", invalid_component()),
                 ("second", "third", rx.fragment(invalid_component())),
                 (
                     "fourth",
-                    rx.cond(True, invalid_component(), rx.fragment(valid_component2())),
+                    rx.cond(
+                        Var.create(True),
+                        invalid_component(),
+                        rx.fragment(valid_component2()),
+                    ),
                 ),
                 (
                     "fifth",
@@ -1220,7 +1439,19 @@ def test_validate_invalid_children():
                     invalid_component(),
                 ),
             )
-        )
+        ),
+    )
+
+
+@pytest.mark.parametrize("children", [[1], "abc"])
+def test_invalid_children_type(children):
+    """Test that children which are not components fail pydantic validation.
+
+    Args:
+        children: The invalid children value.
+    """
+    with pytest.raises(ValidationError):
+        Box(children=children)
 
 
 def test_rename_props():
@@ -1231,6 +1462,7 @@ def test_rename_props():
 
         prop1: Var[str]
         prop2: Var[str]
+        prop1_extra: Var[str]
 
         _rename_props = {"prop1": "renamed_prop1", "prop2": "renamed_prop2"}
 
@@ -1241,10 +1473,12 @@ def test_rename_props():
 
         _rename_props = {"prop2": "subclass_prop2", "prop3": "renamed_prop3"}
 
-    c1 = C1.create(prop1="prop1_1", prop2="prop2_1")
+    c1 = C1.create(prop1="prop1_1", prop2="prop2_1", prop1_extra="extra")
     rendered_c1 = c1.render()
     assert "renamed_prop1={`prop1_1`}" in rendered_c1["props"]
     assert "renamed_prop2={`prop2_1`}" in rendered_c1["props"]
+    # Only exact prop names are renamed, not props sharing a prefix.
+    assert "prop1Extra={`extra`}" in rendered_c1["props"]
 
     c2 = C2.create(prop1="prop1_2", prop2="prop2_2", prop3="prop3_2")
     rendered_c2 = c2.render()
@@ -1282,7 +1516,7 @@ def test_deprecated_props(capsys):
     # but the component still works.
     c1_2 = C1.create(type_="type2", min_="min2", max_="max2")
     out_err = capsys.readouterr()
-    assert out_err.out.count("DeprecationWarning:") == 3
+    assert out_err.out.count("DeprecationWarning:") == 1
     assert not out_err.err
 
     c1_2_render = c1_2.render()
@@ -1,5 +1,6 @@
 """Test fixtures."""
 import contextlib
+import importlib
 import os
 import platform
 import uuid
@@ -21,6 +22,26 @@ from .states import (
     UploadState,
 )
 
+# Modules with large import trees that most test modules pull in.
+PRELOADED_MODULES = (
+    "reflex.components.component",
+    "reflex.components.chakra.layout.box",
+    "reflex.components.radix.themes.typography.text",
+)
+
+
+def pytest_configure(config):
+    """Import the heavy reflex modules once before collection starts.
+
+    Processes forked after this point (e.g. with pytest-forked) inherit the
+    loaded modules instead of importing them again for every test.
+
+    Args:
+        config: The pytest config.
+    """
+    for module in PRELOADED_MODULES:
+        importlib.import_module(module)
+
 
 @pytest.fixture
 def app() -> App:
@@ -236,6 +236,8 @@ def test_get_setter(prop, expected):
         (1, BaseVar(_var_name="1", _var_type=int, _var_is_local=True)),
         ("key", BaseVar(_var_name="key", _var_type=str, _var_is_local=True)),
         (3.14, BaseVar(_var_name="3.14", _var_type=float, _var_is_local=True)),
+        (True, BaseVar(_var_name="true", _var_type=bool, _var_is_local=True)),
+        (1.0, BaseVar(_var_name="1.0", _var_type=float, _var_is_local=True)),
         ([1, 2, 3], BaseVar(_var_name="[1, 2, 3]", _var_type=list, _var_is_local=True)),
         (
             {"a": 1, "b": 2},
@@ -1385,3 +1387,10 @@ def test_invalid_var_operations(operand1_var: Var, operand2_var, operators: List
 )
 def test_var_name_unwrapped(var, expected):
     assert var._var_name_unwrapped == expected
+
+
+def test_create_signed_zero():
+    """Test that 0.0 and -0.0 keep their own names regardless of creation order."""
+    assert Var.create(0.0)._var_name == "0.0"  # type: ignore
+    assert Var.create(-0.0)._var_name == "-0.0"  # type: ignore
+    assert Var.create(0.0)._var_name == "0.0"  # type: ignore
@@ -399,7 +399,7 @@ def test_format_cond(
                 ],
             ],
             Var.create("yellow", _var_is_string=True),
-            "(() => { switch (JSON.stringify(state__state.value)) {case JSON.stringify(1):  return (`red`);  break;case JSON.stringify(2): case JSON.stringify(3):  "
+            "(() => { switch (JSON.stringify(state__state.value)) {case '1':  return (`red`);  break;case '2': case '3':  "
             "return (`blue`);  break;case JSON.stringify(test_state.mapping):  return "
             "(test_state.num1);  break;case JSON.stringify(`${test_state.map_key}-key`):  return (`return-key`);"
             "  break;default:  return (`yellow`);  break;};})()",
@@ -420,6 +420,36 @@ def test_format_match(
     assert format.format_match(condition, match_cases, default) == expected
 
 
+@pytest.mark.parametrize(
+    "condition,expected",
+    [
+        (Var.create(1), "'1'"),
+        (Var.create(-42), "'-42'"),
+        (Var.create(1, _var_is_string=True), "JSON.stringify(`1`)"),
+        (Var.create("first", _var_is_string=True), "'\"first\"'"),
+        (Var.create("two words", _var_is_string=True), "'\"two words\"'"),
+        (Var.create(True), "JSON.stringify(true)"),
+        (Var.create(1.5), "JSON.stringify(1.5)"),
+        (Var.create(2**53), f"JSON.stringify({2**53})"),
+        (Var.create('a"b', _var_is_string=True), 'JSON.stringify(`a"b`)'),
+        (Var.create([1, 2]), "JSON.stringify([1, 2])"),
+        (TestState.num1, "JSON.stringify(test_state.num1)"),
+        (
+            Var.create(f"{TestState.map_key}-key", _var_is_string=True),
+            "JSON.stringify(`${test_state.map_key}-key`)",
+        ),
+    ],
+)
+def test_format_match_case(condition: Var, expected: str):
+    """Test that plain literal match cases are serialized ahead of time.
+
+    Args:
+        condition: The case condition.
+        expected: The expected case label.
+    """
+    assert format.format_match_case(condition) == expected
+
+
 @pytest.mark.parametrize(
     "prop,formatted",
     [